@@ -2,17 +2,15 @@
 CoSim RAG Chatbot Service
 Provides intelligent Q&A about the product using RAG retrieval
 """
+import json
 import os
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-import openai
-import ollama
-import replicate
 
 from vector_store import RAGVectorStore, initialize_vector_store
 
@@ -217,7 +215,8 @@ def generate_ollama_response(
     # Build the final prompt with context
     user_prompt = f"Context:\n{context_text}\n\nQuestion: {query}"
     
-    # Call Ollama API
+    # Call Ollama API (imported here so the client library only loads when used)
+    import ollama
     client = ollama.Client(host=host)
     response = client.chat(
         model=model,
@@ -269,7 +268,8 @@ def generate_replicate_response(
     user_prompt = f"Context:\n{context_text}\n\nQuestion: {query}"
     messages.append({"role": "user", "content": user_prompt})
 
-    # Call Replicate API
+    # Call Replicate API (imported here so the client library only loads when used)
+    import replicate
     output = replicate.run(
         model_version,
         input={"messages": messages}
@@ -291,7 +291,8 @@ def generate_openai_response(
     Generate response using OpenAI (fallback option)
     """
     try:
-        # Set up OpenAI client
+        # Set up OpenAI client (imported here so the library only loads when used)
+        import openai
         client = openai.OpenAI(api_key=api_key)
         
         # Format context
@@ -344,14 +345,36 @@ def generate_openai_response(
         return generate_response_with_context(query, context_docs, conversation_history)
 
 
-@app.get("/", response_model=Dict[str, str])
+def _render_json(content: Dict[str, Any]) -> bytes:
+    """Encode content exactly as FastAPI's JSONResponse would"""
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Static response bodies, serialized once at import instead of per request
+ROOT_RESPONSE_BODY = _render_json({
+    "service": "CoSim Chatbot API",
+    "version": "1.0.0",
+    "status": "running"
+})
+
+SUGGESTIONS_RESPONSE_BODY = _render_json({
+    "suggestions": [
+        "How do I get started with CoSim?",
+        "What simulators are supported?",
+        "Can I use GPUs for training?",
+        "How does real-time collaboration work?",
+        "What's the pricing for CoSim?",
+        "Can I run SLAM experiments?",
+        "How do I train RL agents?",
+        "Is my data secure on CoSim?"
+    ]
+})
+
+
+@app.get("/", response_class=Response)
 async def root():
     """Root endpoint"""
-    return {
-        "service": "CoSim Chatbot API",
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -420,23 +443,12 @@ async def chat_feedback(
     return {"status": "success", "message": "Feedback recorded"}
 
 
-@app.get("/chat/suggestions")
+@app.get("/chat/suggestions", response_class=Response)
 async def get_suggestions():
     """
     Get suggested questions for users
     """
-    return {
-        "suggestions": [
-            "How do I get started with CoSim?",
-            "What simulators are supported?",
-            "Can I use GPUs for training?",
-            "How does real-time collaboration work?",
-            "What's the pricing for CoSim?",
-            "Can I run SLAM experiments?",
-            "How do I train RL agents?",
-            "Is my data secure on CoSim?"
-        ]
-    }
+    return Response(content=SUGGESTIONS_RESPONSE_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -4,10 +4,25 @@ Creates and manages embeddings for product documentation
 """
 import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 import chromadb
+import numpy as np
 from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# Chroma collection holding the product docs and FAQ chunks
+COLLECTION_NAME = 'cosim_product_docs'
+
+# Sentence transformer used for document and query embeddings
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Maximum number of chunks written to Chroma in a single `add` call
+ADD_BATCH_SIZE = 1000
+
+# Number of texts per forward pass of the embedding model
+ENCODE_BATCH_SIZE = 64
 
 
 class RAGVectorStore:
@@ -23,14 +38,51 @@ class RAGVectorStore:
             anonymized_telemetry=False
         ))
         
-        # Load sentence transformer model for embeddings
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Sentence transformer model, loaded on first embed
+        self._embedding_model: Optional["SentenceTransformer"] = None
+        
+        # In-memory copy of the collection, row i of the matrix belonging
+        # to _documents[i], for exact brute-force search
+        self._emb_matrix: Optional[np.ndarray] = None
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
         
-        # Get or create collection
+        # Get or create collection. Embeddings are normalized, so cosine
+        # distance is an inner-product ranking (what a flat IP index gives)
+        # and `1 - distance` is the similarity reported to clients
         self.collection = self.client.get_or_create_collection(
-            name="cosim_product_docs",
-            metadata={"description": "CoSim product documentation and features"}
+            name=COLLECTION_NAME,
+            metadata={
+                "description": "CoSim product documentation and features",
+                "hnsw:space": "cosine"
+            }
         )
+        
+        # Mirror anything the collection already holds
+        self._load_matrix()
+    
+    def _load_matrix(self):
+        """Copy the collection's embeddings into memory"""
+        data = self.collection.get(include=["embeddings", "documents", "metadatas"])
+        self._documents = list(data["documents"] or [])
+        self._metadatas = [metadata or {} for metadata in (data["metadatas"] or [])]
+        
+        embeddings = data["embeddings"]
+        if embeddings is None or len(embeddings) == 0:
+            self._emb_matrix = None
+        else:
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            # Older entries may not have been normalized at encode time
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._emb_matrix = matrix / np.maximum(norms, 1e-12)
+    
+    @property
+    def embedding_model(self) -> "SentenceTransformer":
+        """Load the embedding model the first time it is needed"""
+        if self._embedding_model is None:
+            from sentence_transformers import SentenceTransformer
+            self._embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        return self._embedding_model
     
     def chunk_text(self, text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]:
         """Split text into overlapping chunks for better retrieval"""
@@ -44,6 +96,46 @@ class RAGVectorStore:
         
         return chunks
     
+    def add_documents(
+        self,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        batch_size: int = ADD_BATCH_SIZE
+    ):
+        """Add documents to the collection with as few `add` calls as possible"""
+        # Each `add` is its own SQLite transaction and HNSW insert, so flush
+        # whole files at once and only split very large inputs
+        for i in range(0, len(documents), batch_size):
+            batch_docs = documents[i:i + batch_size]
+            batch_meta = metadatas[i:i + batch_size]
+            embeddings = self.embed(batch_docs)
+            self.collection.add(
+                embeddings=embeddings.tolist(),
+                documents=batch_docs,
+                metadatas=batch_meta,
+                ids=ids[i:i + batch_size]
+            )
+            
+            if self._emb_matrix is None:
+                self._emb_matrix = embeddings
+            else:
+                self._emb_matrix = np.vstack([self._emb_matrix, embeddings])
+            self._documents.extend(batch_docs)
+            self._metadatas.extend(batch_meta)
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in length-sorted batches"""
+        # A single encode call over the whole list lets SentenceTransformer
+        # sort by length before batching, so each batch is only padded to
+        # its own longest text; results come back in the original order
+        embeddings = self.embedding_model.encode(
+            texts,
+            batch_size=ENCODE_BATCH_SIZE,
+            normalize_embeddings=True
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+    
     def load_product_docs(self, docs_path: str = "./product_docs.txt"):
         """Load and index product documentation"""
         # Read documentation
@@ -94,19 +186,7 @@ class RAGVectorStore:
                 ids.append(doc_id)
         
         # Add to collection
-        if documents:
-            # Add in batches to avoid memory issues
-            batch_size = 100
-            for i in range(0, len(documents), batch_size):
-                batch_docs = documents[i:i + batch_size]
-                batch_meta = metadatas[i:i + batch_size]
-                batch_ids = ids[i:i + batch_size]
-                
-                self.collection.add(
-                    documents=batch_docs,
-                    metadatas=batch_meta,
-                    ids=batch_ids
-                )
+        self.add_documents(documents, metadatas, ids)
         
         print(f"✅ Indexed {len(documents)} document chunks from {len(sections)} sections")
     
@@ -177,18 +257,22 @@ class RAGVectorStore:
             })
             ids.append(f"faq_{idx}")
         
-        self.collection.add(
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
+        self.add_documents(documents, metadatas, ids)
         
         print(f"✅ Added {len(faqs)} FAQ entries")
     
     def query(self, query_text: str, n_results: int = 5) -> List[Dict[str, Any]]:
         """Query the vector store for relevant documents"""
+        query_embedding = self.embed([query_text])[0]
+        
+        # Every write goes through add_documents, which keeps the matrix in
+        # step with the collection, so score the whole index with a single
+        # matrix-vector product; an empty store falls through to Chroma
+        if self._emb_matrix is not None:
+            return self._query_in_memory(query_embedding, n_results)
+        
         results = self.collection.query(
-            query_texts=[query_text],
+            query_embeddings=[query_embedding.tolist()],
             n_results=n_results
         )
         
@@ -204,6 +288,25 @@ class RAGVectorStore:
         
         return formatted_results
     
+    def _query_in_memory(self, query_embedding: np.ndarray, n_results: int) -> List[Dict[str, Any]]:
+        """Exact cosine search over the in-memory embedding matrix"""
+        scores = self._emb_matrix @ query_embedding
+        n_results = min(n_results, len(scores))
+        if n_results <= 0:
+            return []
+        
+        top = np.argpartition(-scores, n_results - 1)[:n_results]
+        top = top[np.argsort(-scores[top])]
+        
+        return [
+            {
+                "content": self._documents[i],
+                "metadata": self._metadatas[i],
+                "distance": float(1.0 - scores[i])
+            }
+            for i in top
+        ]
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector store"""
         count = self.collection.count()
@@ -214,8 +317,16 @@ class RAGVectorStore:
         }
 
 
+# Process-wide vector store, created by the first initialize_vector_store call
+_vector_store: Optional[RAGVectorStore] = None
+
+
 def initialize_vector_store():
     """Initialize and populate the vector store"""
+    global _vector_store
+    if _vector_store is not None:
+        return _vector_store
+    
     print("🚀 Initializing RAG Vector Store...")
     
     store = RAGVectorStore()
@@ -224,6 +335,7 @@ def initialize_vector_store():
     stats = store.get_stats()
     if stats["total_documents"] > 0:
         print(f"✅ Vector store already initialized with {stats['total_documents']} documents")
+        _vector_store = store
         return store
     
     # Load product documentation
@@ -241,6 +353,7 @@ def initialize_vector_store():
     print(f"   Total documents: {stats['total_documents']}")
     print(f"   Persist directory: {stats['persist_directory']}")
     
+    _vector_store = store
     return store
 
 
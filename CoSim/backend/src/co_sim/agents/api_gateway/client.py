@@ -15,6 +15,8 @@ SERVICE_MAP = {
     "collab": settings.service_endpoints.collab_base_url.rstrip("/"),
 }
 
+FORWARDED_HEADERS = frozenset({"authorization", "x-request-id", "content-type"})
+
 
 async def forward_request(
     request: Request,
@@ -29,11 +31,11 @@ async def forward_request(
     if not base_url:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Service not configured")
 
-    headers = {
-        key: value
-        for key, value in request.headers.items()
-        if key.lower() in {"authorization", "x-request-id", "content-type"}
-    }
+    headers = {}
+    for name in FORWARDED_HEADERS:
+        value = request.headers.get(name)
+        if value is not None:
+            headers[name] = value
 
     async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
         response = await client.request(
@@ -3,6 +3,7 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from co_sim.agents.api_gateway.routes import router as gateway_router
 from co_sim.core import logging as logging_config
@@ -16,7 +17,12 @@ async def lifespan(app: FastAPI):
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="CoSim API Gateway", version="0.1.0", lifespan=lifespan)
+    app = FastAPI(
+        title="CoSim API Gateway",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     @app.get("/healthz")
     async def healthcheck() -> dict[str, str]:
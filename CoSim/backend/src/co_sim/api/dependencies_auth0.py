@@ -94,7 +94,7 @@ async def get_current_user(
     if credentials:
         token = credentials.credentials
     elif authorization and authorization.startswith("Bearer "):
-        token = authorization.replace("Bearer ", "")
+        token = authorization[len("Bearer ") :]
     
     if not token:
         raise HTTPException(
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Far above any bearer token we issue or accept from Auth0; every verification
+# path rejects longer input before it is hashed or base64-decoded.
+MAX_TOKEN_LENGTH = 4096
+
+
+def token_cache_key(token: str) -> bytes:
+    # The digest is only a lookup key (the signature is still verified on a
+    # miss), so let OpenSSL pick its fastest SHA-256 path.
+    return hashlib.sha256(token.encode(), usedforsecurity=False).digest()
+
+
+class VerifiedTokenCache:
+    """Thread-safe LRU of verified token payloads with a short per-entry TTL."""
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            valid_until, payload = cached
+            if now >= valid_until:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(payload)
+
+    def set(self, key: bytes, payload: dict[str, Any]) -> None:
+        # Never keep a payload past its own expiry.
+        ttl = self.ttl_seconds
+        exp = payload.get("exp")
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, dict(payload))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
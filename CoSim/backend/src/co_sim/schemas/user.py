@@ -8,7 +8,7 @@ from pydantic import BaseModel, EmailStr, Field, field_validator
 from co_sim.schemas.base import TimestampedModel
 
 
-PLAN_CHOICES = {"free", "student", "pro", "team", "enterprise"}
+PLAN_CHOICES = frozenset({"free", "student", "pro", "team", "enterprise"})
 
 
 def _normalize_plan(value: str | None) -> str:
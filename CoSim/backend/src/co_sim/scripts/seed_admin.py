@@ -27,7 +27,7 @@ async def seed_admin_user() -> None:
 
         user = User(
             email=ADMIN_EMAIL,
-            hashed_password=get_password_hash(ADMIN_PASSWORD),
+            hashed_password=await get_password_hash(ADMIN_PASSWORD),
             full_name=ADMIN_FULL_NAME,
             is_active=True,
             is_superuser=True,
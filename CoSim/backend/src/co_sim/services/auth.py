@@ -18,7 +18,7 @@ class UserAlreadyExistsError(Exception):
 
 
 async def register_user(session: AsyncSession, payload: UserCreate) -> UserRead:
-    hashed_password = get_password_hash(payload.password)
+    hashed_password = await get_password_hash(payload.password)
     user = User(
         email=payload.email.lower(),
         hashed_password=hashed_password,
@@ -38,14 +38,14 @@ async def register_user(session: AsyncSession, payload: UserCreate) -> UserRead:
 async def authenticate_user(session: AsyncSession, email: str, password: str) -> tuple[User, str, int] | None:
     result = await session.execute(select(User).where(User.email == email.lower()))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(password, user.hashed_password) or not user.is_active:
+    if not user or not await verify_password(password, user.hashed_password) or not user.is_active:
         return None
     token, expires_in = create_access_token(subject=user.id)
     return user, token, expires_in
 
 
 async def create_api_key(session: AsyncSession, user: User, name: str, scopes: str = "*") -> APIKey:
-    api_key = APIKey(user_id=user.id, name=name, key_hash=get_password_hash(name), scopes=scopes)
+    api_key = APIKey(user_id=user.id, name=name, key_hash=await get_password_hash(name), scopes=scopes)
     session.add(api_key)
     await session.commit()
     await session.refresh(api_key)
@@ -9,6 +9,7 @@ from jose import JWTError, jwt
 from jose.backends.base import Key
 
 from co_sim.core.auth0_config import Auth0Settings, get_auth0_settings
+from co_sim.core.cache import MAX_TOKEN_LENGTH, VerifiedTokenCache, token_cache_key
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
@@ -16,6 +17,10 @@ security = HTTPBearer()
 # Cache for JWKS (JSON Web Key Set)
 _jwks_cache: dict[str, Key] | None = None
 
+# Verified Auth0 payloads, so repeat requests with the same token skip the
+# RS256 signature check (entries never outlive the token's own exp)
+_verified_token_cache = VerifiedTokenCache(ttl_seconds=60.0, max_size=10_000)
+
 
 async def get_jwks(settings: Auth0Settings) -> dict:
     """Fetch JWKS from Auth0."""
@@ -63,6 +68,18 @@ async def verify_auth0_token(
             detail="Auth0 audience is not configured",
         )
     
+    if len(token) > MAX_TOKEN_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials: Token too long",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    cache_key = token_cache_key(token)
+    cached_payload = _verified_token_cache.get(cache_key)
+    if cached_payload is not None:
+        return cached_payload
+    
     try:
         # Get the unverified header to find the key ID
         unverified_header = jwt.get_unverified_header(token)
@@ -98,6 +115,7 @@ async def verify_auth0_token(
             issuer=settings.issuer_url,
         )
         
+        _verified_token_cache.set(cache_key, payload)
         return payload
     
     except JWTError as e:
@@ -1,13 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
 from passlib.context import CryptContext
 
+# Only used to verify legacy hashes that are not plain bcrypt (e.g. bcrypt_sha256).
 pwd_context = CryptContext(schemes=["bcrypt", "bcrypt_sha256"], deprecated="auto")
 
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# bcrypt releases the GIL while hashing, so a dedicated thread pool spreads
+# hashes across cores without blocking the event loop or the default executor.
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+def _verify(plain_password: str, hashed_password: str | None) -> bool:
+    # Auth0-provisioned users have no local password hash.
+    if not hashed_password:
+        return False
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+def _hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("ascii")
+
+
+async def verify_password(plain_password: str, hashed_password: str | None) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, _verify, plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, _hash, password)
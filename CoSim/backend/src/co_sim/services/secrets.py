@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import hashlib
+from functools import lru_cache
 from uuid import UUID
 
 from cryptography.fernet import Fernet
@@ -13,6 +14,7 @@ from co_sim.models.secret import Secret
 from co_sim.schemas.secret import SecretCreate, SecretRead, SecretReveal
 
 
+@lru_cache(maxsize=1)
 def _build_cipher() -> Fernet:
     digest = hashlib.sha256(settings.jwt_secret_key.encode()).digest()
     key = base64.urlsafe_b64encode(digest)
@@ -15,6 +15,8 @@ from co_sim.schemas.session import (
     SessionUpdate,
 )
 
+_STARTED_STATUSES = frozenset({SessionStatus.RUNNING, SessionStatus.STARTING})
+
 
 async def create_session(session: AsyncSession, payload: SessionCreate) -> SessionRead:
     db_session = Session(
@@ -57,9 +59,9 @@ async def update_session(
     data = payload.model_dump(exclude_unset=True)
     for field, value in data.items():
         setattr(db_session, field, value)
-    if "status" in data and data["status"] in {SessionStatus.RUNNING, SessionStatus.STARTING}:
+    if "status" in data and data["status"] in _STARTED_STATUSES:
         db_session.started_at = datetime.now(timezone.utc)
-    if "status" in data and data["status"] in {SessionStatus.TERMINATED}:
+    if "status" in data and data["status"] == SessionStatus.TERMINATED:
         db_session.ended_at = datetime.now(timezone.utc)
     await session.commit()
     await session.refresh(db_session)
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import timedelta
 from typing import Any
 from uuid import UUID
 
-from jose import jwt
+from jose import JWTError, jwk, jwt
 
+from co_sim.core.cache import MAX_TOKEN_LENGTH, VerifiedTokenCache, token_cache_key
 from co_sim.core.config import settings
 
+# The signing key and algorithm list are fixed for the process, so build the
+# jose key object once instead of on every encode/decode.
+_ALGORITHM = settings.jwt_algorithm
+_ALGORITHMS = [_ALGORITHM]
+_SIGNING_KEY = jwk.construct(settings.jwt_secret_key, _ALGORITHM)
+_ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.access_token_expire_minutes)
+
+# Successfully decoded tokens are reused for a few seconds so that repeated
+# requests with the same bearer token skip signature verification.
+_decode_cache = VerifiedTokenCache(ttl_seconds=5.0, max_size=10_000)
+
 
 def create_access_token(subject: UUID, scopes: str | None = None, expires_delta: timedelta | None = None) -> tuple[str, int]:
-    expire_delta = expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
-    expire = datetime.now(timezone.utc) + expire_delta
-    to_encode: dict[str, Any] = {"sub": str(subject), "exp": expire}
+    expires_in = int((expires_delta or _ACCESS_TOKEN_EXPIRE).total_seconds())
+    # jose stores exp as integer epoch seconds, so skip the datetime round trip.
+    to_encode: dict[str, Any] = {"sub": str(subject), "exp": int(time.time()) + expires_in}
     if scopes:
         to_encode["scopes"] = scopes
-    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
-    return encoded_jwt, int(expire_delta.total_seconds())
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=_ALGORITHM)
+    return encoded_jwt, expires_in
 
 
 def decode_token(token: str) -> dict[str, Any]:
-    return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    if len(token) > MAX_TOKEN_LENGTH:
+        raise JWTError("Token too long")
+
+    key = token_cache_key(token)
+    cached = _decode_cache.get(key)
+    if cached is not None:
+        return cached
+
+    payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
+    _decode_cache.set(key, payload)
+    return payload